@@ -35,8 +35,9 @@ ColorFace.to_vis_set = color_face_to_vis_set
 try:
     from honeybee_energy.result.colorobj import ColorRoom as EnergyColorRoom
     from honeybee_energy.result.colorobj import ColorFace as EnergyColorFace
-    from .energy.colorobj import energy_color_room_to_vis_set, color_face_to_vis_set
+    from .energy.colorobj import energy_color_room_to_vis_set, \
+        energy_color_face_to_vis_set
     EnergyColorRoom.to_vis_set = energy_color_room_to_vis_set
-    EnergyColorFace.to_vis_set = color_face_to_vis_set
+    EnergyColorFace.to_vis_set = energy_color_face_to_vis_set
 except ImportError:  # honeybee-energy is not installed
     pass
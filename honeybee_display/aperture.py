@@ -2,6 +2,8 @@
 from ladybug_display.geometry3d import DisplayFace3D
 from ladybug_display.visualization import VisualizationSet, ContextGeometry
 
+from .face import _color_by_attr
+
 
 def aperture_to_vis_set(aperture, color_by='type'):
     """Translate a Honeybee Aperture to a VisualizationSet.
@@ -19,7 +21,7 @@ def aperture_to_vis_set(aperture, color_by='type'):
         single ContextGeometry.
     """
     # get the basic properties for geometry conversion
-    color_by_attr = 'type_color' if color_by.lower() == 'type' else 'bc_color'
+    color_by_attr = _color_by_attr(color_by)
     d_mod = 'SurfaceWithEdges'
     # convert all geometry into DisplayFace3D
     dis_geos = []
@@ -31,6 +33,6 @@ def aperture_to_vis_set(aperture, color_by='type'):
     # build the VisualizationSet and ContextGeometry
     con_geo = ContextGeometry(aperture.identifier, dis_geos)
     con_geo.display_name = aperture.display_name
-    vis_set = VisualizationSet(aperture.identifier, [con_geo])
+    vis_set = VisualizationSet(aperture.identifier, (con_geo,))
     vis_set.display_name = aperture.display_name
     return vis_set
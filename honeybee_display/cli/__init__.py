@@ -8,6 +8,11 @@ import pickle
 import tempfile
 import uuid
 
+try:  # use the faster orjson serializer if it is installed
+    import orjson
+except ImportError:  # orjson is not installed; use the json module
+    orjson = None
+
 from honeybee.model import Model
 from honeybee.cli import main
 
@@ -119,7 +124,8 @@ def display():
     'extensions (since both .vsf and .json can be acceptable). Also note that '
     'ladybug-vtk must be installed in order for the vtkjs or html options to be usable '
     'and the html format refers to a web page with the vtkjs file embedded within it.',
-    type=str, default='vsf', show_default=True)
+    type=click.Choice(['vsf', 'json', 'pkl', 'vtkjs', 'html'], case_sensitive=False),
+    default='vsf', show_default=True)
 @click.option(
     '--output-file', help='Optional file to output the JSON string of '
     'the config object. By default, it will be printed out to stdout',
@@ -161,46 +167,7 @@ def model_to_vis_set(
             hide_grid=hide_grid, grid_data_path=grid_data,
             grid_data_display_mode=grid_data_display_mode,
             active_grid_data=active_grid_data)
-        output_format = output_format.lower()
-        if output_format in ('vsf', 'json'):
-            output_file.write(json.dumps(vis_set.to_dict()))
-        elif output_format == 'pkl':
-            if output_file.name != '<stdout>':
-                out_folder, out_file = os.path.split(output_file.name)
-                vis_set.to_pkl(out_file, out_folder)
-            else:
-                output_file.write(pickle.dumps(vis_set.to_dict()))
-        elif output_format in ('vtkjs', 'html'):
-            if output_file.name == '<stdout>':  # get a temporary file
-                out_file = str(uuid.uuid4())[:6]
-                out_folder = tempfile.gettempdir()
-            else:
-                out_folder, out_file = os.path.split(output_file.name)
-                if out_file.endswith('.vtkjs'):
-                    out_file = out_file[:-6]
-                elif out_file.endswith('.html'):
-                    out_file = out_file[:-5]
-            try:
-                if output_format == 'vtkjs':
-                    vis_set.to_vtkjs(output_folder=out_folder, file_name=out_file)
-                if output_format == 'html':
-                    vis_set.to_html(output_folder=out_folder, file_name=out_file)
-            except AttributeError as ae:
-                raise AttributeError(
-                    'Ladybug-vtk must be installed in order to use --output-format '
-                    'vtkjs.\n{}'.format(ae))
-            if output_file.name == '<stdout>':  # load file contents to stdout
-                out_file_ext = out_file + '.' + output_format
-                out_file_path = os.path.join(out_folder, out_file_ext)
-                if output_format == 'html':
-                    with open(out_file_path, encoding='utf-8') as of:
-                        f_contents = of.read()
-                else:  # vtkjs can only be read as binary
-                    with open(out_file_path, 'rb') as of:
-                        f_contents = of.read()
-                output_file.write(f_contents)
-        else:
-            raise ValueError('Unrecognized output-format "{}".'.format(output_format))
+        _VIS_SET_WRITERS[output_format](vis_set, output_file)
     except Exception as e:
         _logger.exception('Failed to translate Model to VisualizationSet.\n{}'.format(e))
         sys.exit(1)
@@ -208,5 +175,80 @@ def model_to_vis_set(
         sys.exit(0)
 
 
+def _write_json(vis_set, output_file):
+    """Write a VisualizationSet to a JSON output file."""
+    if orjson is None:
+        json.dump(vis_set.to_dict(), output_file)
+        return
+    vs_bytes = orjson.dumps(vis_set.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+    if output_file.name != '<stdout>':
+        with open(output_file.name, 'wb') as of:
+            of.write(vs_bytes)
+    else:  # orjson produces bytes so they must go to the stdout buffer
+        click.get_binary_stream('stdout').write(vs_bytes)
+
+
+def _write_pkl(vis_set, output_file):
+    """Write a VisualizationSet to a pickle output file."""
+    if output_file.name != '<stdout>':
+        out_folder, out_file = os.path.split(output_file.name)
+        vis_set.to_pkl(out_file, out_folder)
+    else:  # pickle is binary so it must go to the stdout buffer
+        pickle.dump(vis_set.to_dict(), click.get_binary_stream('stdout'),
+                    protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _write_vtkjs(vis_set, output_file):
+    """Write a VisualizationSet to a vtkjs output file."""
+    _write_vtk(vis_set, output_file, 'vtkjs')
+
+
+def _write_html(vis_set, output_file):
+    """Write a VisualizationSet to an HTML output file with embedded vtkjs."""
+    _write_vtk(vis_set, output_file, 'html')
+
+
+def _write_vtk(vis_set, output_file, output_format):
+    """Write a VisualizationSet to an output file using ladybug-vtk."""
+    if output_file.name == '<stdout>':  # get a temporary file
+        out_file = str(uuid.uuid4())[:6]
+        out_folder = tempfile.gettempdir()
+    else:
+        out_folder, out_file = os.path.split(output_file.name)
+        if out_file.endswith('.vtkjs'):
+            out_file = out_file[:-6]
+        elif out_file.endswith('.html'):
+            out_file = out_file[:-5]
+    try:
+        if output_format == 'vtkjs':
+            vis_set.to_vtkjs(output_folder=out_folder, file_name=out_file)
+        if output_format == 'html':
+            vis_set.to_html(output_folder=out_folder, file_name=out_file)
+    except AttributeError as ae:
+        raise AttributeError(
+            'Ladybug-vtk must be installed in order to use --output-format '
+            '{}.\n{}'.format(output_format, ae))
+    if output_file.name == '<stdout>':  # load file contents to stdout
+        out_file_ext = out_file + '.' + output_format
+        out_file_path = os.path.join(out_folder, out_file_ext)
+        if output_format == 'html':
+            with open(out_file_path, encoding='utf-8') as of:
+                f_contents = of.read()
+            output_file.write(f_contents)
+        else:  # vtkjs can only be read as binary
+            with open(out_file_path, 'rb') as of:
+                f_contents = of.read()
+            click.get_binary_stream('stdout').write(f_contents)
+
+
+_VIS_SET_WRITERS = {
+    'vsf': _write_json,
+    'json': _write_json,
+    'pkl': _write_pkl,
+    'vtkjs': _write_vtkjs,
+    'html': _write_html
+}
+
+
 # add display sub-group to honeybee CLI
 main.add_command(display)
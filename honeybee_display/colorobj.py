@@ -1,6 +1,4 @@
 """Method to translate a Color Room/Face objects to a VisualizationSet."""
-import math
-
 from ladybug_geometry.geometry3d import Vector3D, Point3D, Polyline3D, Plane, \
     Face3D, Polyface3D
 from ladybug_display.geometry3d import DisplayLineSegment3D, DisplayText3D
@@ -11,6 +9,8 @@ from honeybee.units import conversion_factor_to_meters, parse_distance_string
 from honeybee.facetype import Floor
 from honeybee.face import Face
 
+_Z_UP = Vector3D(0, 0, 1)
+
 
 def color_room_to_vis_set(
         color_room, include_wireframe=True, text_labels=False,
@@ -43,74 +43,26 @@ def color_room_to_vis_set(
 
     # use text labels if requested
     if text_labels:
-        # set up default variables
-        max_txt_h, p_tol = float('inf'), 0.01
-        if units is not None:
-            fac_to_m = conversion_factor_to_meters(units)
-            max_txt_h = 0.25 / fac_to_m
-            max_txt_v = 1.0 / fac_to_m
-            p_tol = parse_distance_string('0.01m', units)
-        label_text = []
         txt_height = None if color_room.legend_parameters.is_text_height_default \
             else color_room.legend_parameters.text_height
         font = color_room.legend_parameters.font
-        # loop through the rooms and create the text labels
-        for room_prop, room in zip(color_room.attributes, color_room.rooms):
-            # compute the center point for the text
-            if units is not None:
-                room_h = room.geometry.max.z - room.geometry.min.z
-                m_vec = Vector3D(0, 0, max_txt_v) if room_h > max_txt_v * 2 \
-                    else Vector3D(0, 0, room_h / 2)
-                floor_faces = [face.geometry for face in room.faces
-                               if isinstance(face.type, Floor)]
-                if len(floor_faces) == 1:
-                    flr_geo = floor_faces[0]
-                    base_pt = flr_geo.center if flr_geo.is_convex else \
-                        flr_geo.pole_of_inaccessibility(p_tol)
-                elif len(floor_faces) == 0:
-                    c_pt = room.geometry.center
-                    base_pt = Point3D(c_pt.x, c_pt.y, room.geometry.min.z)
-                else:
-                    floor_p_face = Polyface3D.from_faces(floor_faces, tolerance)
-                    ne = floor_p_face.naked_edges
-                    floor_outline = Polyline3D.join_segments(ne, tolerance)[0]
-                    flr_geo = Face3D(floor_outline.vertices[:-1])
-                    base_pt = flr_geo.center if flr_geo.is_convex else \
-                        flr_geo.pole_of_inaccessibility(p_tol)
-                base_pt = base_pt.move(m_vec)
-                base_plane = Plane(Vector3D(0, 0, 1), base_pt)
-            else:
-                base_pt = room.geometry.center
-            base_plane = Plane(Vector3D(0, 0, 1), base_pt)
-            # get the text height
-            if txt_height is None:  # auto-calculate default text height
-                txt_len = len(room_prop) if len(room_prop) > 10 else 10
-                txt_h = (room.geometry.max.x - room.geometry.min.x) / txt_len
-            else:
-                txt_h = txt_height
-            txt_h = max_txt_h if txt_h > max_txt_h else txt_h
-            # create the text label
-            label = DisplayText3D(
-                room_prop, base_plane, txt_h, font=font,
-                horizontal_alignment='Center', vertical_alignment='Middle')
-            label_text.append(label)  # append everything to the list
+        room_props = zip(color_room.attributes, color_room.rooms)
+        label_text = _room_text_labels(room_props, txt_height, font, units, tolerance)
         con_geo = ContextGeometry(vis_set.identifier, label_text)
         con_geo.display_name = vis_set.display_name
         vis_set.add_geometry(con_geo)
     else:  # use a colored AnalysisGeometry
         # produce a range of values from the collected attributes
-        attr_dict = {i: val for i, val in enumerate(color_room.attributes_unique)}
-        attr_dict_rev = {val: i for i, val in attr_dict.items()}
-        values = tuple(attr_dict_rev[r_attr] for r_attr in color_room.attributes)
+        values, attr_dict = _ordinal_values(color_room)
         # produce legend parameters with an ordinal dict for the attributes
         l_par = color_room.legend_parameters.duplicate()
-        l_par.segment_count = len(color_room.attributes_unique)
+        l_par.segment_count = len(attr_dict)
         l_par.ordinal_dictionary = attr_dict
         if l_par.is_title_default:
             l_par.title = color_room.attr_name_end.replace('_', ' ').title()
         # create the analysis geometry
         vis_data = VisualizationData(values, l_par)
-        geo = tuple(room.geometry for room in color_room.rooms)
+        geo = tuple([room.geometry for room in color_room.rooms])
         a_geo = AnalysisGeometry(vis_set.identifier, geo, [vis_data])
         a_geo.display_name = vis_set.display_name
         vis_set.add_geometry(a_geo)
@@ -152,67 +104,20 @@ def color_face_to_vis_set(
 
     # use text labels if requested
     if text_labels:
-        # set up default variables
-        max_txt_h, p_tol, offset_from_base = float('inf'), 0.01, 0.005
-        if units is not None:
-            fac_to_m = conversion_factor_to_meters(units)
-            max_txt_h = 0.25 / fac_to_m
-            p_tol = parse_distance_string('0.01m', units)
-            offset_from_base = parse_distance_string('0.005m', units)
-        label_text = []
         txt_height = None if color_face.legend_parameters.is_text_height_default \
             else color_face.legend_parameters.text_height
         font = color_face.legend_parameters.font
-        # loop through the faces and create the text labels
-        for face_prop, f_geo in zip(color_face.attributes, color_face.flat_geometry):
-            if face_prop != 'N/A':
-                # compute the text height
-                if txt_height is None:  # auto-calculate default text height
-                    txt_len = len(face_prop) if len(face_prop) > 10 else 10
-                    dims = [
-                        (f_geo.max.x - f_geo.min.x),
-                        (f_geo.max.y - f_geo.min.y),
-                        (f_geo.max.z - f_geo.min.z)]
-                    dims.sort()
-                    txt_h = dims[1] / txt_len
-                else:
-                    txt_h = txt_height
-                if txt_h < tolerance:
-                    continue
-                txt_h = max_txt_h if txt_h > max_txt_h else txt_h
-                # get the base plane of the geometry
-                if isinstance(f_geo, Face3D):
-                    cent_pt = f_geo.center if f_geo.is_convex else \
-                        f_geo.pole_of_inaccessibility(p_tol)
-                    cent_pt = cent_pt.move(f_geo.normal * offset_from_base)
-                    base_plane = Plane(f_geo.normal, cent_pt)
-                    if base_plane.y.z < 0:  # base plane pointing downwards; rotate it
-                        base_plane = base_plane.rotate(
-                            base_plane.n, math.pi, base_plane.o)
-                    # move base plane a little to avoid overlaps of adjacent labels
-                    if base_plane.n.x != 0:
-                        m_vec = base_plane.y if base_plane.n.x < 0 else -base_plane.y
-                    else:
-                        m_vec = base_plane.y if base_plane.n.z < 0 else -base_plane.y
-                    base_plane = base_plane.move(m_vec * txt_h)
-                else:  #it's a Mesh3D
-                    base_plane = Plane(Vector3D(0, 0, 1), f_geo.center)
-                # create the text label
-                label = DisplayText3D(
-                    face_prop, base_plane, txt_h, font=font,
-                    horizontal_alignment='Center', vertical_alignment='Middle')
-                label_text.append(label)  # append everything to the list
+        face_props = zip(color_face.attributes, color_face.flat_geometry)
+        label_text = _face_text_labels(face_props, txt_height, font, units, tolerance)
         con_geo = ContextGeometry(vis_set.identifier, label_text)
         con_geo.display_name = vis_set.display_name
         vis_set.add_geometry(con_geo)
     else:  # use a colored AnalysisGeometry
         # produce a range of values from the collected attributes
-        attr_dict = {i: val for i, val in enumerate(color_face.attributes_unique)}
-        attr_dict_rev = {val: i for i, val in attr_dict.items()}
-        values = tuple(attr_dict_rev[r_attr] for r_attr in color_face.attributes)
+        values, attr_dict = _ordinal_values(color_face)
         # produce legend parameters with an ordinal dict for the attributes
         l_par = color_face.legend_parameters.duplicate()
-        l_par.segment_count = len(color_face.attributes_unique)
+        l_par.segment_count = len(attr_dict)
         l_par.ordinal_dictionary = attr_dict
         if l_par.is_title_default:
             l_par.title = color_face.attr_name_end.replace('_', ' ').title()
@@ -229,24 +134,172 @@ def color_face_to_vis_set(
     return vis_set
 
 
+def _ordinal_values(color_obj):
+    """Get ordinal values and an ordinal dictionary from a ColorRoom or ColorFace.
+
+    The attributes_unique of the color object are already sorted and cached on
+    the object so they are used as-is to preserve the order of the legend.
+
+    Returns:
+        A tuple with two elements.
+
+        -   values: A tuple of integers with one value for each attribute.
+
+        -   attr_dict: A dictionary mapping each integer to its attribute text.
+    """
+    unique = color_obj.attributes_unique
+    attr_index = {val: i for i, val in enumerate(unique)}
+    values = tuple(map(attr_index.__getitem__, color_obj.attributes))
+    return values, dict(enumerate(unique))
+
+
+def _room_text_labels(room_props, txt_height=None, font='Arial',
+                      units=None, tolerance=0.01):
+    """Get a list of DisplayText3D to label Rooms.
+
+    Args:
+        room_props: An iterable of (text, Room) tuples for the labels.
+        txt_height: Optional number for the text height. If None, it will be
+            computed from the dimensions of each Room. (Default: None).
+        font: Text for the font of the labels. (Default: Arial).
+        units: Optional text for the units of the Rooms, which is used to set
+            the maximum text height and the distance of the text to the ground.
+        tolerance: Tolerance value used to compute the label point. (Default: 0.01).
+    """
+    # set up default variables
+    max_txt_h, p_tol = float('inf'), 0.01
+    if units is not None:
+        fac_to_m = conversion_factor_to_meters(units)
+        max_txt_h = 0.25 / fac_to_m
+        max_txt_v = 1.0 / fac_to_m
+        p_tol = parse_distance_string('0.01m', units)
+    # loop through the rooms and create the text labels
+    label_text = []
+    for room_prop, room in room_props:
+        room_geo = room.geometry
+        min_pt, max_pt = room_geo.min, room_geo.max
+        # compute the center point for the text
+        if units is not None:
+            room_h = max_pt.z - min_pt.z
+            m_vec = Vector3D(0, 0, max_txt_v) if room_h > max_txt_v * 2 \
+                else Vector3D(0, 0, room_h / 2)
+            floor_faces = [face.geometry for face in room.faces
+                           if isinstance(face.type, Floor)]
+            if len(floor_faces) == 1:
+                flr_geo = floor_faces[0]
+                base_pt = flr_geo.center if flr_geo.is_convex else \
+                    flr_geo.pole_of_inaccessibility(p_tol)
+            elif len(floor_faces) == 0:
+                c_pt = room_geo.center
+                base_pt = Point3D(c_pt.x, c_pt.y, min_pt.z)
+            else:
+                floor_p_face = Polyface3D.from_faces(floor_faces, tolerance)
+                ne = floor_p_face.naked_edges
+                floor_outline = Polyline3D.join_segments(ne, tolerance)[0]
+                flr_geo = Face3D(floor_outline.vertices[:-1])
+                base_pt = flr_geo.center if flr_geo.is_convex else \
+                    flr_geo.pole_of_inaccessibility(p_tol)
+            base_pt = base_pt.move(m_vec)
+        else:
+            base_pt = room_geo.center
+        base_plane = Plane(_Z_UP, base_pt)
+        # get the text height
+        if txt_height is None:  # auto-calculate default text height
+            txt_len = len(room_prop) if len(room_prop) > 10 else 10
+            txt_h = (max_pt.x - min_pt.x) / txt_len
+        else:
+            txt_h = txt_height
+        txt_h = max_txt_h if txt_h > max_txt_h else txt_h
+        # create the text label
+        label = DisplayText3D(
+            room_prop, base_plane, txt_h, font=font,
+            horizontal_alignment='Center', vertical_alignment='Middle')
+        label_text.append(label)  # append everything to the list
+    return label_text
+
+
+def _face_text_labels(face_props, txt_height=None, font='Arial',
+                      units=None, tolerance=0.01):
+    """Get a list of DisplayText3D to label Face3D or Mesh3D geometries.
+
+    Args:
+        face_props: An iterable of (text, geometry) tuples for the labels. Any
+            text that is N/A will not have a label generated for it.
+        txt_height: Optional number for the text height. If None, it will be
+            computed from the dimensions of each geometry. (Default: None).
+        font: Text for the font of the labels. (Default: Arial).
+        units: Optional text for the units of the geometry, which is used to set
+            the maximum text height and the offset of the text from the geometry.
+        tolerance: Tolerance value used to eliminate very small text. (Default: 0.01).
+    """
+    # set up default variables
+    max_txt_h, p_tol, offset_from_base = float('inf'), 0.01, 0.005
+    if units is not None:
+        fac_to_m = conversion_factor_to_meters(units)
+        max_txt_h = 0.25 / fac_to_m
+        p_tol = parse_distance_string('0.01m', units)
+        offset_from_base = parse_distance_string('0.005m', units)
+    # loop through the faces and create the text labels
+    label_text = []
+    for face_prop, f_geo in face_props:
+        if face_prop == 'N/A':
+            continue
+        # compute the text height
+        if txt_height is None:  # auto-calculate default text height
+            txt_len = len(face_prop) if len(face_prop) > 10 else 10
+            min_pt, max_pt = f_geo.min, f_geo.max
+            dims = sorted(
+                (max_pt.x - min_pt.x, max_pt.y - min_pt.y, max_pt.z - min_pt.z))
+            txt_h = dims[1] / txt_len
+        else:
+            txt_h = txt_height
+        if txt_h < tolerance:
+            continue
+        txt_h = max_txt_h if txt_h > max_txt_h else txt_h
+        # get the base plane of the geometry
+        if isinstance(f_geo, Face3D):
+            cent_pt = f_geo.center if f_geo.is_convex else \
+                f_geo.pole_of_inaccessibility(p_tol)
+            normal = f_geo.normal
+            base_plane = Plane(normal, cent_pt)
+            x_axis, y_axis = base_plane.x, base_plane.y
+            if y_axis.z < 0:  # base plane pointing downwards; flip it
+                x_axis, y_axis = -x_axis, -y_axis
+            # move base plane a little to avoid overlaps of adjacent labels
+            if normal.x != 0:
+                m_vec = y_axis if normal.x < 0 else -y_axis
+            else:
+                m_vec = y_axis if normal.z < 0 else -y_axis
+            base_pt = cent_pt.move(normal * offset_from_base + m_vec * txt_h)
+            base_plane = Plane(normal, base_pt, x_axis)
+        else:  # it's a Mesh3D
+            base_plane = Plane(_Z_UP, f_geo.center)
+        # create the text label
+        label = DisplayText3D(
+            face_prop, base_plane, txt_h, font=font,
+            horizontal_alignment='Center', vertical_alignment='Middle')
+        label_text.append(label)  # append everything to the list
+    return label_text
+
+
 def _room_wireframe(rooms):
     """Process Rooms into a ContextGeometry for Wireframe."""
     wireframe = []
     for room in rooms:
         for face in room.faces:
-            _process_wireframe(face, wireframe, 2)
-            for ap in face._apertures:
-                _process_wireframe(ap, wireframe)
-            for dr in face._doors:
-                _process_wireframe(dr, wireframe)
+            _process_face_wireframe(face, wireframe)
         for shade in room.shades:
-            sh_geo = shade.geometry
-            for seg in sh_geo.boundary_segments:
-                wireframe.append(DisplayLineSegment3D(seg, line_width=1))
-            if sh_geo.has_holes:
-                for hole in sh_geo.hole_segments:
-                    for seg in hole:
-                        wireframe.append(DisplayLineSegment3D(seg, line_width=1))
+            _process_face3d_wireframe(shade.geometry, wireframe)
+    con_geo = ContextGeometry('Wireframe', wireframe)
+    return con_geo
+
+
+def _face_wireframe_with_apertures(faces):
+    """Process Faces with their Apertures and Doors into a ContextGeometry for Wireframe.
+    """
+    wireframe = []
+    for face in faces:
+        _process_face_wireframe(face, wireframe)
     con_geo = ContextGeometry('Wireframe', wireframe)
     return con_geo
 
@@ -258,34 +311,36 @@ def _face_wireframe(faces):
         lw = 2 if isinstance(face, Face) else 1
         f_geo = face.geometry
         if isinstance(f_geo, Face3D):
-            for seg in f_geo.boundary_segments:
-                wireframe.append(DisplayLineSegment3D(seg, line_width=lw))
-            if f_geo.has_holes:
-                for hole in f_geo.hole_segments:
-                    for seg in hole:
-                        wireframe.append(DisplayLineSegment3D(seg, line_width=lw))
+            _process_face3d_wireframe(f_geo, wireframe, lw)
         else:  # it's a Mesh3D
-            for seg in f_geo.edges:
-                wireframe.append(DisplayLineSegment3D(seg, line_width=lw))
+            wireframe.extend(
+                [DisplayLineSegment3D(seg, line_width=lw) for seg in f_geo.edges])
     con_geo = ContextGeometry('Wireframe', wireframe)
     return con_geo
 
 
+def _process_face_wireframe(face, wireframe):
+    """Process a Honeybee Face with its Apertures and Doors into DisplayLinesegment3D.
+    """
+    _process_wireframe(face, wireframe, 2)
+    for ap in face._apertures:
+        _process_wireframe(ap, wireframe)
+    for dr in face._doors:
+        _process_wireframe(dr, wireframe)
+
+
 def _process_wireframe(geo_obj, wireframe, line_width=1):
     """Process the boundary and holes of a Honeybee geometry into DisplayLinesegment3D.
     """
-    face3d = geo_obj.geometry
-    for seg in face3d.boundary_segments:
-        wireframe.append(DisplayLineSegment3D(seg, line_width=line_width))
-    if face3d.has_holes:
-        for hole in face3d.holes:
-            for seg in face3d.boundary_segments:
-                wireframe.append(DisplayLineSegment3D(seg, line_width=line_width))
+    _process_face3d_wireframe(geo_obj.geometry, wireframe, line_width)
     for shade in geo_obj.shades:
-        sh_geo = shade.geometry
-        for seg in sh_geo.boundary_segments:
-            wireframe.append(DisplayLineSegment3D(seg, line_width=1))
-        if sh_geo.has_holes:
-            for hole in sh_geo.holes:
-                for seg in sh_geo.boundary_segments:
-                    wireframe.append(DisplayLineSegment3D(seg, line_width=1))
+        _process_face3d_wireframe(shade.geometry, wireframe)
+
+
+def _process_face3d_wireframe(face3d, wireframe, line_width=1):
+    """Process the boundary and holes of a Face3D into DisplayLinesegment3D."""
+    segs = face3d.boundary_segments
+    if face3d.has_holes:
+        segs = segs + tuple(seg for hole in face3d.hole_segments for seg in hole)
+    dis_seg = DisplayLineSegment3D
+    wireframe.extend([dis_seg(seg, line_width=line_width) for seg in segs])
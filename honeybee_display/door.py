@@ -2,6 +2,8 @@
 from ladybug_display.geometry3d import DisplayFace3D
 from ladybug_display.visualization import VisualizationSet, ContextGeometry
 
+from .face import _color_by_attr
+
 
 def door_to_vis_set(door, color_by='type'):
     """Translate a Honeybee Door to a VisualizationSet.
@@ -18,7 +20,7 @@ def door_to_vis_set(door, color_by='type'):
         A VisualizationSet object that represents the Door with a single ContextGeometry.
     """
     # get the basic properties for geometry conversion
-    color_by_attr = 'type_color' if color_by.lower() == 'type' else 'bc_color'
+    color_by_attr = _color_by_attr(color_by)
     d_mod = 'SurfaceWithEdges'
     # convert all geometry into DisplayFace3D
     dis_geos = []
@@ -30,6 +32,6 @@ def door_to_vis_set(door, color_by='type'):
     # build the VisualizationSet and ContextGeometry
     con_geo = ContextGeometry(door.identifier, dis_geos)
     con_geo.display_name = door.display_name
-    vis_set = VisualizationSet(door.identifier, [con_geo])
+    vis_set = VisualizationSet(door.identifier, (con_geo,))
     vis_set.display_name = door.display_name
     return vis_set
@@ -1,9 +1,14 @@
 """Method to translate a Face to a VisualizationSet."""
+from operator import attrgetter
+from itertools import chain
+
 from ladybug_display.geometry3d import DisplayFace3D
 from ladybug_display.visualization import VisualizationSet, ContextGeometry
 
+_COLOR_ATTRS = {'type': 'type_color', 'boundary_condition': 'bc_color'}
+
 
-def face_to_vis_set(face, color_by='type'):
+def face_to_vis_set(face, color_by='type', display_mode='SurfaceWithEdges'):
     """Translate a Honeybee Face to a VisualizationSet.
 
     Args:
@@ -14,40 +19,95 @@ def face_to_vis_set(face, color_by='type'):
             * type
             * boundary_condition
 
+        display_mode: Text for the display_mode of the resulting DisplayFace3D.
+            (Default: SurfaceWithEdges). Choose from the following:
+
+            * Surface
+            * SurfaceWithEdges
+            * Wireframe
+            * Points
+
     Returns:
         A VisualizationSet object that represents the Face with a single ContextGeometry.
     """
     # get the basic properties for geometry conversion
-    color_by_attr = 'type_color' if color_by.lower() == 'type' else 'bc_color'
+    color_by_attr = _color_by_attr(color_by)
     # convert all geometry into DisplayFace3D
-    dis_geos = _face_display_geometry(face, color_by_attr)
+    dis_geos = _face_display_geometry(face, color_by_attr, display_mode)
     # build the VisualizationSet and ContextGeometry
     con_geo = ContextGeometry(face.identifier, dis_geos)
     con_geo.display_name = face.display_name
-    vis_set = VisualizationSet(face.identifier, [con_geo])
+    vis_set = VisualizationSet(face.identifier, (con_geo,))
     vis_set.display_name = face.display_name
     return vis_set
 
 
+def faces_to_vis_set(faces, color_by='type', display_mode='SurfaceWithEdges'):
+    """Translate a list of Honeybee Faces to a VisualizationSet.
+
+    All Faces are placed in a single ContextGeometry, which is lighter than
+    building a separate VisualizationSet for each Face. The identifier of the
+    Face that produced each DisplayFace3D is stored under the "group_ids" key
+    of the ContextGeometry user_data so that the geometry can still be filtered
+    by Face.
+
+    Args:
+        faces: A list of Honeybee Face objects to be converted to a VisualizationSet.
+        color_by: Text for the property that dictates the colors of the Face
+            geometry. (Default: type). Choose from the following:
+
+            * type
+            * boundary_condition
+
+        display_mode: Text for the display_mode of the resulting DisplayFace3D.
+            (Default: SurfaceWithEdges). Choose from the following:
+
+            * Surface
+            * SurfaceWithEdges
+            * Wireframe
+            * Points
+
+    Returns:
+        A VisualizationSet object that represents the Faces with a single
+        ContextGeometry.
+    """
+    if len(faces) == 0:
+        raise ValueError('faces_to_vis_set requires at least one Face.')
+    # get the basic properties for geometry conversion
+    color_by_attr = _color_by_attr(color_by)
+    # convert all geometry into DisplayFace3D
+    dis_geos, group_ids = [], []
+    for face in faces:
+        f_geos = _face_display_geometry(face, color_by_attr, display_mode)
+        dis_geos.extend(f_geos)
+        group_ids.extend([face.identifier] * len(f_geos))
+    # build the VisualizationSet and ContextGeometry
+    vs_id = 'Faces_{}'.format(faces[0].identifier)
+    con_geo = ContextGeometry(vs_id, dis_geos)
+    con_geo.display_name = 'Faces'
+    con_geo.user_data = {'group_ids': group_ids}
+    vis_set = VisualizationSet(vs_id, (con_geo,))
+    vis_set.display_name = 'Faces'
+    return vis_set
+
+
 def _face_display_geometry(face, color_by_attr, d_mod='SurfaceWithEdges'):
     """Get DisplayFace3D that represent a Honeybee Face."""
-    dis_geos = []
-    f_col = getattr(face, color_by_attr)
-    dis_geos.append(DisplayFace3D(face.punched_geometry, f_col, d_mod))
-    _add_display_shade(face, dis_geos, color_by_attr, d_mod)
-    for ap in face._apertures:
-        a_col = getattr(ap, color_by_attr)
-        dis_geos.append(DisplayFace3D(ap.geometry, a_col, d_mod))
-        _add_display_shade(ap, dis_geos, color_by_attr, d_mod)
-    for dr in face._doors:
-        d_col = getattr(dr, color_by_attr)
-        dis_geos.append(DisplayFace3D(dr.geometry, d_col, d_mod))
-        _add_display_shade(dr, dis_geos, color_by_attr, d_mod)
+    get_col, dis_face = attrgetter(color_by_attr), DisplayFace3D
+    dis_geos = [dis_face(face.punched_geometry, get_col(face), d_mod)]
+    dis_geos += [dis_face(shd.geometry, get_col(shd), d_mod) for shd in face.shades]
+    dis_geos += [
+        dis_face(geo_obj.geometry, get_col(geo_obj), d_mod)
+        for sub_f in chain(face._apertures, face._doors)
+        for geo_obj in chain((sub_f,), sub_f.shades)
+    ]
     return dis_geos
 
 
-def _add_display_shade(shaded_obj, dis_geos, color_by_attr, d_mod='SurfaceWithEdges'):
-    """Add display objects to represent shaded assigned to an object."""
-    for shd in shaded_obj.shades:
-        s_col = getattr(shd, color_by_attr)
-        dis_geos.append(DisplayFace3D(shd.geometry, s_col, d_mod))
+def _color_by_attr(color_by):
+    """Get the name of the color attribute that corresponds to a color_by input."""
+    color_attr = _COLOR_ATTRS.get(color_by) or _COLOR_ATTRS.get(str(color_by).lower())
+    if color_attr is None:
+        raise ValueError('Unrecognized color_by input "{}". Choose from: {}.'.format(
+            color_by, ', '.join(_COLOR_ATTRS)))
+    return color_attr
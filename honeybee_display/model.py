@@ -5,8 +5,8 @@ import json
 from ladybug_geometry.geometry3d import Point3D, Face3D
 from ladybug.datatype.generic import GenericType
 from ladybug.color import Color
-from ladybug_display.geometry3d import DisplayPoint3D, DisplayLineSegment3D, \
-    DisplayPolyline3D, DisplayFace3D, DisplayMesh3D
+from ladybug_display.geometry3d import DisplayPoint3D, DisplayPolyline3D, \
+    DisplayFace3D, DisplayMesh3D
 from ladybug_display.visualization import VisualizationSet, ContextGeometry, \
     AnalysisGeometry, VisualizationData, VisualizationMetaData
 from honeybee.boundarycondition import Outdoors, Ground, Surface
@@ -15,7 +15,8 @@ from honeybee.colorobj import ColorRoom, ColorFace
 from honeybee.shade import Shade
 from honeybee.typing import clean_string
 
-from .colorobj import color_room_to_vis_set, color_face_to_vis_set
+from .colorobj import color_room_to_vis_set, color_face_to_vis_set, \
+    _process_face3d_wireframe
 
 TYPE_COLORS = {
     'Wall': Color(230, 180, 60),
@@ -434,32 +435,23 @@ def model_to_vis_set_wireframe(model):
         A VisualizationSet with a single ContextGeometry and a list of
         DisplayLineSegment3D for the wireframe of the Model.
     """
-    def _process_wireframe(face3d, wireframe, line_width=1):
-        """Process the boundary and holes into DisplayLinesegment3D."""
-        for seg in face3d.boundary_segments:
-            wireframe.append(DisplayLineSegment3D(seg, line_width=line_width))
-        if face3d.has_holes:
-            for hole in face3d.hole_segments:
-                for seg in hole:
-                    wireframe.append(DisplayLineSegment3D(seg, line_width=line_width))
-
     # loop through all of the objects and add their wire frames
     wireframe = []
     for face in model.faces:
-        _process_wireframe(face.geometry, wireframe, 2)
+        _process_face3d_wireframe(face.geometry, wireframe, 2)
         for ap in face._apertures:
-            _process_wireframe(ap.geometry, wireframe)
+            _process_face3d_wireframe(ap.geometry, wireframe)
         for dr in face._doors:
-            _process_wireframe(dr.geometry, wireframe)
+            _process_face3d_wireframe(dr.geometry, wireframe)
     for ap in model._orphaned_apertures:
-        _process_wireframe(ap.geometry, wireframe)
+        _process_face3d_wireframe(ap.geometry, wireframe)
     for dr in model._orphaned_doors:
-        _process_wireframe(dr.geometry, wireframe)
+        _process_face3d_wireframe(dr.geometry, wireframe)
     for shd in model.indoor_shades:
-        _process_wireframe(shd.geometry, wireframe)
+        _process_face3d_wireframe(shd.geometry, wireframe)
     for shd in model.outdoor_shades:
         lw = 2 if shd.is_detached else 1
-        _process_wireframe(shd.geometry, wireframe, lw)
+        _process_face3d_wireframe(shd.geometry, wireframe, lw)
 
     # build the VisualizationSet and return it
     if len(wireframe) == 0:
@@ -1,7 +1,10 @@
 """Method to translate a Room to a VisualizationSet."""
+from operator import attrgetter
+
+from ladybug_display.geometry3d import DisplayFace3D
 from ladybug_display.visualization import VisualizationSet, ContextGeometry
 
-from .face import _face_display_geometry, _add_display_shade
+from .face import _face_display_geometry, _color_by_attr
 
 
 def room_to_vis_set(room, color_by='type'):
@@ -19,15 +22,17 @@ def room_to_vis_set(room, color_by='type'):
         A VisualizationSet object that represents the Room with a single ContextGeometry.
     """
     # get the basic properties for geometry conversion
-    color_by_attr = 'type_color' if color_by.lower() == 'type' else 'bc_color'
+    color_by_attr = _color_by_attr(color_by)
     # convert all geometry into DisplayFace3D
     dis_geos = []
     for face in room.faces:
         dis_geos.extend(_face_display_geometry(face, color_by_attr))
-    _add_display_shade(room, dis_geos, color_by_attr)
+    get_col = attrgetter(color_by_attr)
+    dis_geos += [DisplayFace3D(shd.geometry, get_col(shd), 'SurfaceWithEdges')
+                 for shd in room.shades]
     # build the VisualizationSet and ContextGeometry
     con_geo = ContextGeometry(room.identifier, dis_geos)
     con_geo.display_name = room.display_name
-    vis_set = VisualizationSet(room.identifier, [con_geo])
+    vis_set = VisualizationSet(room.identifier, (con_geo,))
     vis_set.display_name = room.display_name
     return vis_set
@@ -2,6 +2,8 @@
 from ladybug_display.geometry3d import DisplayFace3D
 from ladybug_display.visualization import VisualizationSet, ContextGeometry
 
+from .face import _color_by_attr
+
 
 def shade_to_vis_set(shade, color_by='type'):
     """Translate a Honeybee Shade to a VisualizationSet.
@@ -19,7 +21,7 @@ def shade_to_vis_set(shade, color_by='type'):
         single ContextGeometry.
     """
     # get the basic properties for geometry conversion
-    color_by_attr = 'type_color' if color_by.lower() == 'type' else 'bc_color'
+    color_by_attr = _color_by_attr(color_by)
     d_mod = 'SurfaceWithEdges'
     # convert all geometry into DisplayFace3D
     a_col = getattr(shade, color_by_attr)
@@ -27,6 +29,6 @@ def shade_to_vis_set(shade, color_by='type'):
     # build the VisualizationSet and ContextGeometry
     con_geo = ContextGeometry(shade.identifier, dis_geos)
     con_geo.display_name = shade.display_name
-    vis_set = VisualizationSet(shade.identifier, [con_geo])
+    vis_set = VisualizationSet(shade.identifier, (con_geo,))
     vis_set.display_name = shade.display_name
     return vis_set
@@ -1,8 +1,13 @@
 """Test cli."""
 import os
 import time
+import json
+import pickle
+import pytest
 from click.testing import CliRunner
+from ladybug_display.visualization import VisualizationSet
 
+import honeybee_display.cli as display_cli
 from honeybee_display.cli import model_to_vis_set
 
 
@@ -18,3 +23,73 @@ def test_model_to_vis_set_shade_mesh():
     assert run_time < 10
     assert os.path.isfile(output_vis)
     os.remove(output_vis)
+
+
+def test_model_to_vis_set_json():
+    input_model = './tests/json/single_family_home.hbjson'
+    output_vis = './tests/json/single_family_home.vsf'
+    runner = CliRunner()
+    cmd_args = [input_model, '--output-format', 'vsf', '--output-file', output_vis]
+    result = runner.invoke(model_to_vis_set, cmd_args)
+    assert result.exit_code == 0
+    assert os.path.isfile(output_vis)
+    vis_set = VisualizationSet.from_file(output_vis)
+    assert len(vis_set) == 7
+    os.remove(output_vis)
+
+
+def test_model_to_vis_set_pkl_stdout():
+    input_model = './tests/json/single_family_home.hbjson'
+    runner = CliRunner()
+    cmd_args = [input_model, '--output-format', 'pkl']
+    result = runner.invoke(model_to_vis_set, cmd_args)
+    assert result.exit_code == 0
+    vis_set = VisualizationSet.from_dict(pickle.loads(result.stdout_bytes))
+    assert len(vis_set) == 7
+
+
+def test_model_to_vis_set_bad_format():
+    input_model = './tests/json/single_family_home.hbjson'
+    runner = CliRunner()
+    cmd_args = [input_model, '--output-format', 'obj']
+    result = runner.invoke(model_to_vis_set, cmd_args)
+    assert result.exit_code != 0
+
+
+def test_model_to_vis_set_json_stdout():
+    input_model = './tests/json/single_family_home.hbjson'
+    runner = CliRunner()
+    cmd_args = [input_model, '--output-format', 'json']
+    result = runner.invoke(model_to_vis_set, cmd_args)
+    assert result.exit_code == 0
+    vis_set = VisualizationSet.from_dict(json.loads(result.stdout_bytes))
+    assert len(vis_set) == 7
+
+
+def _check_json_outputs(runner):
+    """Check the JSON output of model-to-vis written to a file and to stdout."""
+    input_model = './tests/json/single_family_home.hbjson'
+    output_vis = './tests/json/single_family_home_check.vsf'
+    cmd_args = [input_model, '--output-format', 'json', '--output-file', output_vis]
+    result = runner.invoke(model_to_vis_set, cmd_args)
+    assert result.exit_code == 0
+    vis_set = VisualizationSet.from_file(output_vis)
+    assert len(vis_set) == 7
+    os.remove(output_vis)
+
+    cmd_args = [input_model, '--output-format', 'json']
+    result = runner.invoke(model_to_vis_set, cmd_args)
+    assert result.exit_code == 0
+    vis_set = VisualizationSet.from_dict(json.loads(result.stdout_bytes))
+    assert len(vis_set) == 7
+
+
+def test_model_to_vis_set_json_orjson(monkeypatch):
+    orjson = pytest.importorskip('orjson')
+    monkeypatch.setattr(display_cli, 'orjson', orjson)
+    _check_json_outputs(CliRunner())
+
+
+def test_model_to_vis_set_json_no_orjson(monkeypatch):
+    monkeypatch.setattr(display_cli, 'orjson', None)
+    _check_json_outputs(CliRunner())
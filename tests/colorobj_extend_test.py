@@ -0,0 +1,68 @@
+"""Test the ColorRoom and ColorFace to_vis_set methods."""
+from ladybug_geometry.geometry3d import Point3D, Face3D, Polyface3D
+from honeybee.room import Room
+from honeybee.colorobj import ColorRoom, ColorFace
+from ladybug_display.geometry3d import DisplayLineSegment3D, DisplayText3D
+from ladybug_display.visualization import VisualizationSet, ContextGeometry, \
+    AnalysisGeometry
+
+
+def _donut_room():
+    """Get a Room with holes in its top and bottom Faces."""
+    bound_pts = [Point3D(0, 0), Point3D(3, 0), Point3D(3, 3), Point3D(0, 3)]
+    hole_pts = [Point3D(1, 1, 0), Point3D(2, 1, 0), Point3D(1.5, 2, 0)]
+    face = Face3D(bound_pts, None, [hole_pts])
+    polyface = Polyface3D.from_offset_face(face, 3)
+    return Room.from_polyface3d('DonutZone', polyface)
+
+
+def _segment_count(faces):
+    """Get the number of boundary and hole segments across several Faces."""
+    count = 0
+    for face in faces:
+        f_geo = face.geometry
+        count += len(f_geo.boundary_segments)
+        if f_geo.has_holes:
+            count += sum(len(h) for h in f_geo.holes)
+    return count
+
+
+def test_color_room_to_vis_set():
+    """Test the ColorRoom.to_vis_set() method with a Room that has holes."""
+    room = _donut_room()
+    color_room = ColorRoom([room], 'display_name')
+    vis_set = color_room.to_vis_set()
+
+    assert isinstance(vis_set, VisualizationSet)
+    assert len(vis_set) == 2
+    assert isinstance(vis_set[0], AnalysisGeometry)
+    assert isinstance(vis_set[1], ContextGeometry)
+    assert len(vis_set[1]) == _segment_count(room.faces)
+    for geo in vis_set[1]:
+        assert isinstance(geo, DisplayLineSegment3D)
+
+
+def test_color_face_to_vis_set():
+    """Test the ColorFace.to_vis_set() method with Faces that have holes."""
+    room = _donut_room()
+    color_face = ColorFace(room.faces, 'display_name')
+    vis_set = color_face.to_vis_set()
+
+    assert isinstance(vis_set, VisualizationSet)
+    assert len(vis_set) == 2
+    assert isinstance(vis_set[0], AnalysisGeometry)
+    assert len(vis_set[1]) == _segment_count(room.faces)
+
+
+def test_color_face_to_vis_set_text_labels():
+    """Test that ColorFace text labels are always oriented upwards."""
+    room = _donut_room()
+    color_face = ColorFace(room.faces, 'display_name')
+    vis_set = color_face.to_vis_set(text_labels=True, units='Meters')
+
+    assert isinstance(vis_set[0], ContextGeometry)
+    assert len(vis_set[0]) == len(room.faces)
+    for label, face in zip(vis_set[0], room.faces):
+        assert isinstance(label, DisplayText3D)
+        assert label.plane.n.is_equivalent(face.normal, 1e-6)
+        assert label.plane.y.z >= -1e-9
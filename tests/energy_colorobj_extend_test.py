@@ -0,0 +1,109 @@
+"""Test the honeybee-energy ColorRoom and ColorFace to_vis_set methods."""
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.datacollection import HourlyContinuousCollection
+from ladybug.datatype.energy import Energy
+from ladybug.header import Header
+from ladybug.legend import LegendParameters
+from ladybug_display.geometry3d import DisplayLineSegment3D, DisplayText3D
+from ladybug_display.visualization import VisualizationSet, ContextGeometry, \
+    AnalysisGeometry
+from honeybee.model import Model
+from honeybee_energy.result.colorobj import ColorRoom, ColorFace
+
+from honeybee_display.energy.colorobj import energy_color_room_to_vis_set, \
+    energy_color_face_to_vis_set, color_face_to_vis_set
+
+
+def _hourly_data(identifier, key, value):
+    """Get an HourlyContinuousCollection with a constant value for an object."""
+    header = Header(Energy(), 'kWh', AnalysisPeriod(), {key: identifier.upper()})
+    return HourlyContinuousCollection(header, [value] * 8760)
+
+
+def _segment_count(geo_objs):
+    """Get the number of wireframe segments across several Honeybee objects."""
+    count = 0
+    for obj in geo_objs:
+        f_geo = obj.geometry
+        count += len(f_geo.boundary_segments)
+        if f_geo.has_holes:
+            count += sum(len(h) for h in f_geo.holes)
+    return count
+
+
+def test_energy_color_room_to_vis_set():
+    """Test the to_vis_set method of the honeybee-energy ColorRoom."""
+    model = Model.from_hbjson('./tests/json/single_family_home.hbjson')
+    data = [_hourly_data(room.identifier, 'Zone', 0.12345 * (i + 1))
+            for i, room in enumerate(model.rooms)]
+    l_par = LegendParameters()
+    l_par.decimal_count = 3
+    color_room = ColorRoom(data, model.rooms, l_par)
+    assert ColorRoom.to_vis_set is energy_color_room_to_vis_set
+
+    vis_set = color_room.to_vis_set()
+    assert isinstance(vis_set, VisualizationSet)
+    assert len(vis_set) == 2
+    assert isinstance(vis_set[0], AnalysisGeometry)
+    assert len(vis_set[0][0].values) == len(model.rooms)
+    assert isinstance(vis_set[1], ContextGeometry)
+    wire_objs = []
+    for room in model.rooms:
+        for face in room.faces:
+            wire_objs.append(face)
+            wire_objs.extend(face.shades)
+            for sub_f in face.apertures + face.doors:
+                wire_objs.append(sub_f)
+                wire_objs.extend(sub_f.shades)
+        wire_objs.extend(room.shades)
+    assert len(vis_set[1]) == _segment_count(wire_objs)
+    for geo in vis_set[1]:
+        assert isinstance(geo, DisplayLineSegment3D)
+
+    vis_set = color_room.to_vis_set(
+        include_wireframe=False, text_labels=True, units=model.units)
+    assert len(vis_set) == 1
+    assert len(vis_set[0]) == len(color_room.matched_rooms)
+    for label, val in zip(vis_set[0], color_room.matched_values):
+        assert isinstance(label, DisplayText3D)
+        assert label.text == '{:.3f}'.format(val)
+
+
+def test_energy_color_face_to_vis_set():
+    """Test the to_vis_set method of the honeybee-energy ColorFace."""
+    model = Model.from_hbjson('./tests/json/single_family_home.hbjson')
+    faces = model.faces
+    data = [_hourly_data(face.identifier, 'Surface', 0.5 * (i + 1))
+            for i, face in enumerate(faces)]
+    l_par = LegendParameters()
+    l_par.decimal_count = 1
+    color_face = ColorFace(data, faces, l_par)
+    assert ColorFace.to_vis_set is energy_color_face_to_vis_set
+
+    vis_set = color_face.to_vis_set()
+    assert isinstance(vis_set, VisualizationSet)
+    assert len(vis_set) == 2
+    assert isinstance(vis_set[0], AnalysisGeometry)
+    assert len(vis_set[0][0].values) == len(color_face.matched_flat_geometry)
+    wire_objs = []
+    for face in color_face.faces:
+        wire_objs.append(face)
+        wire_objs.extend(face.shades)
+        for sub_f in face.apertures + face.doors:
+            wire_objs.append(sub_f)
+            wire_objs.extend(sub_f.shades)
+    assert len(vis_set[1]) == _segment_count(wire_objs)
+
+    vis_set = color_face.to_vis_set(
+        include_wireframe=False, text_labels=True, units=model.units)
+    assert len(vis_set) == 1
+    assert len(vis_set[0]) == len(color_face.matched_flat_geometry)
+    face_texts = set('{:.1f}'.format(val) for val in color_face.matched_values)
+    for label in vis_set[0]:
+        assert isinstance(label, DisplayText3D)
+        assert label.text in face_texts
+
+
+def test_color_face_to_vis_set_alias():
+    """Test that the old name of the energy ColorFace translator still works."""
+    assert color_face_to_vis_set is energy_color_face_to_vis_set
@@ -1,4 +1,6 @@
 """Test the Face to_vis_set method."""
+import pytest
+
 from ladybug_geometry.geometry3d import Point3D, Face3D, Plane
 from honeybee.face import Face
 from honeybee.aperture import Aperture
@@ -6,6 +8,8 @@ from honeybee.door import Door
 from ladybug_display.geometry3d import DisplayFace3D
 from ladybug_display.visualization import VisualizationSet, ContextGeometry
 
+from honeybee_display.face import faces_to_vis_set
+
 
 def test_face_to_vis_set():
     """Test the default output of Face.to_vis_set()."""
@@ -24,3 +28,68 @@ def test_face_to_vis_set():
     assert isinstance(vis_set[0], ContextGeometry)
     for geo in vis_set[0]:
         assert isinstance(geo, DisplayFace3D)
+
+
+def test_faces_to_vis_set():
+    """Test the faces_to_vis_set function."""
+    face_1_face3d = Face3D.from_rectangle(10, 10, Plane(o=Point3D(0, 0, 3)))
+    face_2_face3d = Face3D.from_rectangle(10, 10, Plane(o=Point3D(10, 0, 3)))
+    ap_face3d = Face3D.from_rectangle(2, 2, Plane(o=Point3D(12, 2, 3)))
+    face_1 = Face('Test_Roof_1', face_1_face3d)
+    face_2 = Face('Test_Roof_2', face_2_face3d)
+    aperture = Aperture('Test_Skylight', ap_face3d)
+    face_2.add_aperture(aperture)
+    vis_set = faces_to_vis_set([face_1, face_2])
+
+    assert isinstance(vis_set, VisualizationSet)
+    assert len(vis_set) == 1
+    assert isinstance(vis_set[0], ContextGeometry)
+    assert len(vis_set[0]) == 3
+    for geo in vis_set[0]:
+        assert isinstance(geo, DisplayFace3D)
+    group_ids = vis_set[0].user_data['group_ids']
+    assert group_ids == ['Test_Roof_1', 'Test_Roof_2', 'Test_Roof_2']
+
+
+def test_face_to_vis_set_display_mode():
+    """Test the display_mode argument of Face.to_vis_set()."""
+    face_face3d = Face3D.from_rectangle(10, 10, Plane(o=Point3D(0, 0, 3)))
+    ap_face3d = Face3D.from_rectangle(2, 2, Plane(o=Point3D(2, 2, 3)))
+    face = Face('Test_Roof', face_face3d)
+    face.add_aperture(Aperture('Test_Skylight', ap_face3d))
+
+    vis_set = face.to_vis_set()
+    for geo in vis_set[0]:
+        assert geo.display_mode == 'SurfaceWithEdges'
+
+    vis_set = face.to_vis_set(display_mode='Surface')
+    assert len(vis_set[0]) == 2
+    for geo in vis_set[0]:
+        assert geo.display_mode == 'Surface'
+
+
+def test_face_to_vis_set_color_by():
+    """Test the color_by argument of Face.to_vis_set()."""
+    face_face3d = Face3D.from_rectangle(10, 10, Plane(o=Point3D(0, 0, 3)))
+    ap_face3d = Face3D.from_rectangle(2, 2, Plane(o=Point3D(2, 2, 3)))
+    dr_face3d = Face3D.from_rectangle(2, 2, Plane(o=Point3D(7, 7, 3)))
+    face = Face('Test_Roof', face_face3d)
+    aperture = Aperture('Test_Skylight', ap_face3d)
+    door = Door('Test_Trap_Door', dr_face3d)
+    aperture.extruded_border(0.2)
+    face.add_aperture(aperture)
+    face.add_door(door)
+
+    vis_set = face.to_vis_set()
+    assert len(vis_set[0]) == 3 + len(aperture.shades)
+    assert vis_set[0][0].color == face.type_color
+    assert vis_set[0][1].color == aperture.type_color
+
+    vis_set = face.to_vis_set('boundary_condition')
+    assert vis_set[0][0].color == face.bc_color
+
+    vis_set = face.to_vis_set('Boundary_Condition')
+    assert vis_set[0][0].color == face.bc_color
+
+    with pytest.raises(ValueError):
+        face.to_vis_set('construction')
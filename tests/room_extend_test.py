@@ -1,6 +1,7 @@
 """Test the Room to_vis_set method."""
-from ladybug_geometry.geometry3d import Point3D, Face3D, Polyface3D
+from ladybug_geometry.geometry3d import Point3D, Face3D, Polyface3D, Plane
 from honeybee.room import Room
+from honeybee.shade import Shade
 from ladybug_display.geometry3d import DisplayFace3D
 from ladybug_display.visualization import VisualizationSet, ContextGeometry
 
@@ -12,10 +13,13 @@ def test_room_to_vis_set():
     face = Face3D(bound_pts, None, [hole_pts])
     polyface = Polyface3D.from_offset_face(face, 3)
     room = Room.from_polyface3d('DonutZone', polyface)
+    shade_face3d = Face3D.from_rectangle(3, 1, Plane(o=Point3D(0, -1, 3)))
+    room.add_outdoor_shade(Shade('Overhang', shade_face3d))
     vis_set = room.to_vis_set()
 
     assert isinstance(vis_set, VisualizationSet)
     assert len(vis_set) == 1
     assert isinstance(vis_set[0], ContextGeometry)
+    assert len(vis_set[0]) == len(room.faces) + 1
     for geo in vis_set[0]:
         assert isinstance(geo, DisplayFace3D)